@@ -5,4 +5,10 @@ from notifelect import cli
 
 if __name__ == "__main__":
     with contextlib.suppress(KeyboardInterrupt):
-        asyncio.run(cli.main())
+        try:
+            # uvloop.run was added in uvloop 0.18; older installs fall back too.
+            from uvloop import run
+        except ImportError:
+            asyncio.run(cli.main())
+        else:
+            run(cli.main())
@@ -6,7 +6,7 @@ import os
 
 import asyncpg
 
-from notifelect.models import MessageExchange
+from notifelect.models import decoder
 from notifelect.queries import Queries, QueryBuilder
 
 
@@ -78,6 +78,16 @@ def cliparser() -> argparse.Namespace:
         default=os.environ.get("PGPASSWORD"),
     )
 
+    common_arguments.add_argument(
+        "--pg-statement-cache-size",
+        help=(
+            "Size of the prepared statement cache per connection. Set to 0 when "
+            "connecting through PgBouncer in transaction pooling mode."
+        ),
+        type=int,
+        default=100,
+    )
+
     parser = argparse.ArgumentParser(
         formatter_class=argparse.ArgumentDefaultsHelpFormatter,
         prog="notifelect",
@@ -135,6 +145,7 @@ async def connection(parsed: argparse.Namespace) -> asyncpg.Connection:
         port=parsed.pg_port or None,
         user=parsed.pg_user or None,
         password=parsed.pg_password or None,
+        statement_cache_size=parsed.pg_statement_cache_size,
     )
 
 
@@ -161,7 +172,7 @@ async def main() -> None:  # noqa: C901
             conn = await connection(parsed)
             await conn.add_listener(
                 QueryBuilder().channel,
-                lambda *x: print(repr(MessageExchange.model_validate_json(x[-1]))),
+                lambda *x: print(repr(decoder.decode(x[-1]))),
             )
 
             await asyncio.Future()
@@ -1,30 +1,28 @@
 from __future__ import annotations
 
-from typing import Literal, NewType
+import uuid
+from datetime import datetime
+from typing import Annotated, Final, Literal, TypeAlias
 
-from pydantic import UUID4, AwareDatetime, BaseModel
+import msgspec
 
-Channel = NewType(
-    "Channel",
-    str,
-)
+# Aliases only document intent; unlike NewType they cost no call to construct.
+Channel: TypeAlias = str
+Namespace: TypeAlias = str
+Sequence: TypeAlias = int
 
-Namespace = NewType(
-    "Namespace",
-    str,
-)
+MessageType: TypeAlias = Literal["Ping", "Pong", "Trigger"]
 
-Sequence = NewType(
-    "Sequence",
-    int,
-)
 
-
-class MessageExchange(BaseModel):
+class MessageExchange(msgspec.Struct, frozen=True, gc=False):
     channel: Channel
-    message_id: UUID4
+    message_id: uuid.UUID
     namespace: Namespace
-    process_id: UUID4
-    sent_at: AwareDatetime
+    process_id: uuid.UUID
+    sent_at: Annotated[datetime, msgspec.Meta(tz=True)]
     sequence: Sequence
-    type: Literal["Ping", "Pong"]
+    type: MessageType
+
+
+decoder: Final = msgspec.json.Decoder(MessageExchange)
+encoder: Final = msgspec.json.Encoder()
@@ -1,13 +1,10 @@
 from __future__ import annotations
 
-import asyncio
 import dataclasses
 import os
-from typing import TYPE_CHECKING, Final
-
-if TYPE_CHECKING:
-    import asyncpg
+from typing import Final, Iterable
 
+import asyncpg
 
 from . import models
 
@@ -23,7 +20,7 @@ def add_prefix(string: str) -> str:
 @dataclasses.dataclass
 class QueryBuilder:
     channel: Final[models.Channel] = dataclasses.field(
-        default_factory=lambda: models.Channel(add_prefix("ch_notifelect")),
+        default_factory=lambda: add_prefix("ch_notifelect"),
         kw_only=True,
     )
 
@@ -55,41 +52,61 @@ class QueryBuilder:
     """
 
     def create_notify_query(self) -> str:
-        return f"""
-    SELECT pg_notify('{self.channel}', $1);
+        return """
+    SELECT pg_notify($1, $2);
     """
 
 
 @dataclasses.dataclass
 class Queries:
-    connection: asyncpg.Connection
+    connection: asyncpg.Connection | asyncpg.Pool
     query_builder: QueryBuilder = dataclasses.field(
         default_factory=QueryBuilder,
     )
-    lock: asyncio.Lock = dataclasses.field(
-        default_factory=asyncio.Lock,
+    statements: dict[str, asyncpg.prepared_stmt.PreparedStatement] = dataclasses.field(
+        default_factory=dict,
         init=False,
     )
 
     async def install(self) -> None:
-        async with self.lock:
-            await self.connection.execute(self.query_builder.create_install_query())
+        await self.connection.execute(self.query_builder.create_install_query())
 
     async def uninstall(self) -> None:
-        async with self.lock:
-            await self.connection.execute(self.query_builder.create_uninstall_query())
+        await self.connection.execute(self.query_builder.create_uninstall_query())
 
     async def sequence(self) -> models.Sequence:
-        async with self.lock:
-            return models.Sequence(
-                await self.connection.fetchval(
-                    self.query_builder.create_next_sequence_query(),
-                )
-            )
-
-    async def notify(self, event: models.BaseModel) -> None:
-        async with self.lock:
-            await self.connection.execute(
-                self.query_builder.create_notify_query(),
-                event.model_dump_json(),
-            )
+        query = self.query_builder.create_next_sequence_query()
+        if isinstance(self.connection, asyncpg.Pool):
+            return await self.connection.fetchval(query)
+
+        return await (await self.prepared(query)).fetchval()
+
+    async def prepared(self, query: str) -> asyncpg.prepared_stmt.PreparedStatement:
+        """
+        Returns the prepared statement for a query, preparing it on first use
+        so later calls skip the parse step. Only used with a single connection;
+        a pool relies on asyncpg's statement cache of whichever connection it
+        hands out.
+        """
+        assert isinstance(self.connection, asyncpg.Connection)
+        if (statement := self.statements.get(query)) is None:
+            statement = self.statements[query] = await self.connection.prepare(query)
+        return statement
+
+    async def notify(self, payload: str) -> None:
+        query = self.query_builder.create_notify_query()
+        if isinstance(self.connection, asyncpg.Pool):
+            await self.connection.execute(query, self.query_builder.channel, payload)
+            return
+
+        await (await self.prepared(query)).fetchval(self.query_builder.channel, payload)
+
+    async def notify_many(self, payloads: Iterable[str]) -> None:
+        query = self.query_builder.create_notify_query()
+        channel = self.query_builder.channel
+        args = [(channel, payload) for payload in payloads]
+        if isinstance(self.connection, asyncpg.Pool):
+            await self.connection.executemany(query, args)
+            return
+
+        await (await self.prepared(query)).executemany(args)
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import dataclasses
+import sys
 from datetime import timedelta
 from typing import AsyncGenerator
 
@@ -36,3 +38,142 @@ async def test_one_winner(N: int) -> None:
 
     outcomes = await asyncio.gather(*[process() for _ in range(N)])
     assert sum(o.winner for o in outcomes) == 1
+
+
+@pytest.mark.skipif(sys.version_info < (3, 12), reason="eager_task_factory is 3.12+")
+@pytest.mark.parametrize("N", (1, 2, 3, 5, 25))
+async def test_one_winner_eager_tasks(N: int) -> None:
+    async def process() -> Outcome:
+        settings = Settings(
+            election_interval=timedelta(seconds=0.5),
+            election_timeout=timedelta(seconds=0.1),
+            eager_tasks=True,
+        )
+        async with (
+            connection() as conn,
+            Coordinator(conn, settings=settings) as outcome,
+        ):
+            await asyncio.sleep(settings.election_interval.total_seconds() * 2)
+            return outcome
+
+    loop = asyncio.get_running_loop()
+    assert loop.get_task_factory() is None
+    outcomes = await asyncio.gather(*[process() for _ in range(N)])
+    assert sum(o.winner for o in outcomes) == 1
+    assert loop.get_task_factory() is None
+
+
+@pytest.mark.skipif(sys.version_info < (3, 12), reason="eager_task_factory is 3.12+")
+async def test_failed_enter_leaves_task_factory(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Points the coordinator at a sequence that was never installed.
+    monkeypatch.setenv("NOTIFELECT_PREFIX", "missing_")
+    loop = asyncio.get_running_loop()
+    async with connection() as conn:
+        with pytest.raises(asyncpg.UndefinedTableError):
+            async with Coordinator(conn, settings=Settings(eager_tasks=True)):
+                pass
+    assert loop.get_task_factory() is None
+
+
+@pytest.mark.parametrize("N", (1, 2, 3, 5, 25))
+async def test_one_winner_pool(N: int) -> None:
+    async def process(pool: asyncpg.Pool) -> Outcome:
+        settings = Settings(
+            election_interval=timedelta(seconds=0.5),
+            election_timeout=timedelta(seconds=0.1),
+        )
+        async with Coordinator(pool, settings=settings) as outcome:
+            await asyncio.sleep(settings.election_interval.total_seconds() * 2)
+            return outcome
+
+    async with asyncpg.create_pool(min_size=1, max_size=N + 4) as pool:
+        outcomes = await asyncio.gather(*[process(pool) for _ in range(N)])
+    assert sum(o.winner for o in outcomes) == 1
+
+
+async def test_failed_enter_releases_pool_connection(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def add_listener(*_: object) -> None:
+        raise RuntimeError("LISTEN failed")
+
+    monkeypatch.setattr(asyncpg.Connection, "add_listener", add_listener)
+    # Terminated rather than closed, as closing waits for a leaked connection.
+    pool = await asyncpg.create_pool(min_size=1, max_size=1)
+    try:
+        with pytest.raises(RuntimeError):
+            async with Coordinator(pool):
+                pass
+        assert pool.get_idle_size() == 1
+    finally:
+        pool.terminate()
+
+
+@pytest.mark.parametrize("join_after", (0.5, 1.0, 1.9))
+async def test_one_winner_during_join(join_after: float) -> None:
+    def settings() -> Settings:
+        return Settings(
+            election_interval=timedelta(seconds=2),
+            election_timeout=timedelta(seconds=0.2),
+        )
+
+    async with connection() as conn, Coordinator(conn, settings=settings()) as incumbent:
+        await asyncio.sleep(join_after)
+        assert incumbent.winner
+
+        async with connection() as conn, Coordinator(conn, settings=settings()) as joiner:
+            # Sample for longer than an interval, so every join phase is covered.
+            for _ in range(25):
+                await asyncio.sleep(0.1)
+                assert incumbent.winner + joiner.winner <= 1
+            assert joiner.winner
+            assert not incumbent.winner
+
+
+@pytest.mark.parametrize("N", (1, 2, 5))
+async def test_one_winner_per_namespace(N: int) -> None:
+    async def process(namespace: str) -> Outcome:
+        settings = Settings(
+            namespace=namespace,
+            election_interval=timedelta(seconds=0.5),
+            election_timeout=timedelta(seconds=0.1),
+        )
+        async with (
+            connection() as conn,
+            Coordinator(conn, settings=settings) as outcome,
+        ):
+            await asyncio.sleep(settings.election_interval.total_seconds() * 2)
+            return outcome
+
+    namespaces = ("", "a", 'b"c')
+    outcomes = await asyncio.gather(*[process(ns) for ns in namespaces for _ in range(N)])
+    for i, _ in enumerate(namespaces):
+        assert sum(o.winner for o in outcomes[i * N : (i + 1) * N]) == 1
+
+
+async def test_new_winner_on_exit() -> None:
+    settings = Settings(
+        election_interval=timedelta(seconds=2),
+        election_timeout=timedelta(seconds=0.1),
+    )
+
+    async with contextlib.AsyncExitStack() as stack:
+        coordinators = [
+            Coordinator(
+                await stack.enter_async_context(connection()),
+                settings=dataclasses.replace(settings),
+            )
+            for _ in range(3)
+        ]
+        outcomes = [await c.__aenter__() for c in coordinators]
+        await asyncio.sleep(settings.election_interval_seconds + 0.5)
+        assert sum(o.winner for o in outcomes) == 1
+
+        # The leaving winner triggers an election well before the next interval.
+        winner = next(c for c, o in zip(coordinators, outcomes) if o.winner)
+        await winner.__aexit__(None, None, None)
+        await asyncio.sleep(0.5)
+
+        remaining = [(c, o) for c, o in zip(coordinators, outcomes) if c is not winner]
+        assert sum(o.winner for _, o in remaining) == 1
+
+        for c, _ in remaining:
+            await c.__aexit__(None, None, None)
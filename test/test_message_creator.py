@@ -0,0 +1,62 @@
+from datetime import datetime, timedelta, timezone
+
+import msgspec
+import pytest
+
+from notifelect import models
+from notifelect.election_manager import MessageCreator, Settings
+
+
+@pytest.mark.parametrize(
+    "namespace",
+    (
+        "",
+        "ns",
+        'quo"ted',
+        # Equal to the template placeholders.
+        "2000-01-01T00:00:00Z",
+        "00000000-0000-4000-8000-000000000000",
+        "-4611686018427387904",
+        '"sent_at":"',
+    ),
+)
+def test_rendered_messages_validate(namespace: str) -> None:
+    settings = Settings(namespace=namespace)
+    settings.sequence = 7
+    creator = MessageCreator(settings, "ch_test")
+
+    for payload, type, sequence in (
+        (creator.ping(), "Ping", 7),
+        (creator.pong(), "Pong", 7),
+        (creator.trigger(), "Trigger", 7),
+    ):
+        parsed = msgspec.json.decode(payload, type=models.MessageExchange)
+        assert parsed.channel == "ch_test"
+        assert parsed.namespace == namespace
+        assert parsed.process_id == settings.process_id
+        assert parsed.sequence == sequence
+        assert parsed.type == type
+        assert abs(parsed.sent_at - datetime.now(tz=timezone.utc)) < timedelta(seconds=1)
+
+
+@pytest.mark.parametrize("N", (1, 2, 3, 5, 64, 1024))
+def test_rendered_messages_unique(N: int) -> None:
+    settings = Settings()
+    settings.sequence = 1
+    creator = MessageCreator(settings, "ch_test")
+
+    parsed = [msgspec.json.decode(creator.pong(), type=models.MessageExchange) for _ in range(N)]
+    assert len({p.message_id for p in parsed}) == N
+    assert all(p.message_id.version == 4 for p in parsed)
+    assert len(creator.templates) == 1
+
+
+def test_template_shared_across_sequences() -> None:
+    settings = Settings()
+    creator = MessageCreator(settings, "ch_test")
+
+    for sequence in (1, 10, 2**40):
+        settings.sequence = sequence
+        parsed = msgspec.json.decode(creator.ping(), type=models.MessageExchange)
+        assert parsed.sequence == sequence
+    assert len(creator.templates) == 1